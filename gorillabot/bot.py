@@ -19,6 +19,7 @@
 
 from configure import Configurator
 from executor import Executor
+from functools import partial
 import json
 import logging
 from logging import handlers
@@ -31,17 +32,25 @@ import socket
 import threading
 from time import sleep, strftime, time
 
+_BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+_CONFIG_PATH = os.path.join(os.path.dirname(_BASE_PATH), "config.json")
+_LOG_PATH = os.path.join(_BASE_PATH, "logs")
+_PLUGINS_PATH = os.path.join(_BASE_PATH, "plugins")
+_HOSTMASK_RE = re.compile(r':?(?P<nick>.*?)!~?(?P<user>.*?)@(?P<host>.*)')
+_NEWLINE_RE = re.compile(r'(\n|\r)')
+
 
 class Bot(object):
     """The core of the IRC bot. It maintains the IRC connection, and delegates other tasks."""
 
     def __init__(self):
-        self.base_path = os.path.dirname(os.path.abspath(__file__))
-        self.config_path = os.path.abspath(os.path.join(self.base_path, "..", "config.json"))
-        self.log_path = os.path.abspath(os.path.join(self.base_path, 'logs'))
+        self.base_path = _BASE_PATH
+        self.config_path = _CONFIG_PATH
+        self.log_path = _LOG_PATH
 
         self.configuration = None
         self.configuration_name = None
+        self.command_prefixes = None  # Message starts that address the bot, set once configured
         self.last_message_sent = time()
         self.last_ping_sent = time()
         self.last_received = None
@@ -55,6 +64,9 @@ class Bot(object):
         self.message_q = queue.Queue()
         self.executor = Executor(self, self.message_q, self.shutdown)
         self.header = {"User-Agent": "GorillaBot (https://github.com/molly/GorillaBot)"}
+        # Callables that build a message from a line, keyed on the line's IRC command
+        self.message_types = {"NOTICE": partial(Notice, self), "PONG": partial(Ping, self),
+                              "PRIVMSG": self.classify_privmsg}
 
         self.initialize()
 
@@ -73,6 +85,15 @@ class Bot(object):
                 self.shutdown_message = 'No ping response in 60 seconds.'
                 self.shutdown.set()
 
+    def classify_privmsg(self, *line):
+        """Build a Command if this PRIVMSG is addressed to the bot, or a Privmsg otherwise."""
+        length = len(line)
+        nick = self.configuration["nick"]
+        is_pm = length >= 3 and line[2] == nick
+        if is_pm or (length >= 4 and line[3].startswith(self.command_prefixes)):
+            return Command(self, *line, is_pm=is_pm)
+        return Privmsg(self, *line, is_pm=is_pm)
+
     def connect(self):
         """Connect to the IRC server."""
         self.logger.debug('Thread created.')
@@ -98,23 +119,14 @@ class Bot(object):
         """Inspect this line and determine if further processing is necessary."""
         length = len(line)
         message = None
-        if 2 >= length >= 1:
-            if line[0] == "PING":
-                message = Ping(self, *line)
-        if length >= 2:
-            if line[1] == "PONG":
-                message = Ping(self, *line)
+        if 2 >= length >= 1 and line[0] == "PING":
+            message = Ping(self, *line)
+        elif length >= 2:
+            message_type = self.message_types.get(line[1])
+            if message_type:
+                message = message_type(*line)
             elif line[1].isdigit():
                 message = Numeric(self, *line)
-            elif line[1] == "NOTICE":
-                message = Notice(self, *line)
-            elif line[1] == "PRIVMSG":
-                nick = self.configuration["nick"]
-                if (length >= 3 and line[2] == nick) or (length >= 4 and (
-                    line[3].startswith(":!") or line[3].startswith(":" + nick))):
-                    message = Command(self, *line)
-                else:
-                    message = Privmsg(self, *line)
         if message:
             self.message_q.put(message)
         else:
@@ -163,7 +175,7 @@ class Bot(object):
 
     def get_configuration(self):
         """Get the configuration dict for the active configuration."""
-        with open(self.config_path, 'r') as f:
+        with open(self.config_path, 'rb') as f:
             blob = json.load(f)
         return blob[self.configuration_name]
 
@@ -188,6 +200,7 @@ class Bot(object):
         try:
             self.configuration_name = Configurator().configure()
             self.configuration = self.get_configuration()
+            self.command_prefixes = (":!", ":" + self.configuration["nick"])
         except KeyboardInterrupt:
             self.logger.info("Caught KeyboardInterrupt. Shutting down.")
         self.start()
@@ -227,12 +240,12 @@ class Bot(object):
     def load_commands(self):
         """Load commands from the pickle files if they exist."""
         try:
-            with open(self.base_path + '/plugins/commands.pkl', 'rb') as admin_file:
+            with open(os.path.join(_PLUGINS_PATH, 'commands.pkl'), 'rb') as admin_file:
                 admin_commands = pickle.load(admin_file)
         except (OSError, IOError):
             admin_commands = None
         try:
-            with open(self.base_path + '/plugins/admincommands.pkl', 'rb') as command_file:
+            with open(os.path.join(_PLUGINS_PATH, 'admincommands.pkl'), 'rb') as command_file:
                 commands = pickle.load(command_file)
         except (OSError, IOError):
             commands = None
@@ -293,7 +306,7 @@ class Bot(object):
 
     def parse_hostmask(self, nick):
         """Parse out the parts of the hostmask."""
-        m = re.match(':?(?P<nick>.*?)!~?(?P<user>.*?)@(?P<host>.*)', nick)
+        m = _HOSTMASK_RE.match(nick)
         if m:
             return {"nick": m.group("nick"), "user": m.group("user"), "host": m.group("host")}
         else:
@@ -319,7 +332,7 @@ class Bot(object):
         if (time() - self.last_message_sent) < 1:
             sleep(1)
         try:
-            message = re.sub(r'(\n|\r)', "", message)
+            message = _NEWLINE_RE.sub("", message)
             self.socket.sendall(bytes((message[:510] + "\r\n"), "utf-8"))
         except socket.error:
             self.shutdown_message = "Send failed."
@@ -380,15 +393,16 @@ class Bot(object):
     def update_configuration(self, updated_configuration):
         """Update the full configuration blob with the new settings, then write it to the file.
         Also updates the stored self.configuration dict."""
-        with open(self.config_path, 'r') as f:
+        with open(self.config_path, 'rb') as f:
             blob = json.load(f)
         updated_configuration = {self.configuration_name: updated_configuration}
         if blob:
             blob.update(updated_configuration)
         else:
             blob = updated_configuration
+        data = json.dumps(blob, indent=4)
         with open(self.config_path, "w") as f:
-            json.dump(blob, f, indent=4)
+            f.write(data)
         self.configuration = blob[self.configuration_name]
 
 if __name__ == "__main__":
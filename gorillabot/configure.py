@@ -15,20 +15,35 @@
 # DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from getpass import getpass
 import json
 import logging
 import os
 import re
 
+_BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+_CONFIG_PATH = os.path.join(os.path.dirname(_BASE_PATH), "config.json")
+_SEP_RE = re.compile(r'[,\s]+')
+
 
 class Configurator(object):
     """Handles the configuration settings in the database."""
+    __slots__ = ("base_path", "file_path", "logger", "settings_cache")
+
+    # Settings every configuration must have, in the order they are prompted for
+    OPTIONS = ("nick", "realname", "ident", "chans", "botops", "password", "youtube", "forecast")
+    # Prompt label, default and whether input is hidden for each single-value option
+    PROMPTS = {"nick": ("Nick", "GorillaBot", False),
+               "realname": ("Real name", "GorillaBot", False),
+               "ident": ("Ident", "GorillaBot", False),
+               "password": ("Server password (optional)", None, True),
+               "youtube": ("YouTube API key (optional)", None, True),
+               "forecast": ("Forecast.io API key (optional)", None, True)}
 
     def __init__(self):
-        self.base_path = os.path.dirname(os.path.abspath(__file__))
-        self.file_path = os.path.abspath(os.path.join(self.base_path, "..", "config.json"))
+        self.base_path = _BASE_PATH
+        self.file_path = _CONFIG_PATH
         self.logger = logging.getLogger("GorillaBot")
+        self.settings_cache = None  # (stamp, settings) of the last read or write
 
     def configure(self):
         """Provide the user with prompts to interact with the configuration of the bot."""
@@ -61,7 +76,9 @@ class Configurator(object):
                       "[3] Remove configuration\n[4] Exit")
                 ans = input("")
                 if ans == "0":
-                    return self.load_settings()
+                    name = self.load_settings()
+                    if name:
+                        return name
                 elif ans == "1":
                     return self.create_new()
                 elif ans == "2":
@@ -75,18 +92,34 @@ class Configurator(object):
     def reset(self):
         """Set all "joined" values to false for channels."""
         settings = self.get_settings()
-        for config in settings.keys():
-            for chan in settings[config]["chans"].keys():
-                settings[config]["chans"][chan]["joined"] = False
-            for op in settings[config]["botops"]:
-                settings[config]["botops"][op] = {"user": "", "host": ""}
+        if settings is None:
+            # Malformed file the user chose to keep; configure() asks again and stops
+            return
+        for name, config in settings.items():
+            try:
+                # Look both up before changing anything, so incomplete configurations are untouched
+                chans, botops = config["chans"], config["botops"]
+                for chan in chans.values():
+                    chan["joined"] = False
+                for op in botops:
+                    botops[op] = {"user": "", "host": ""}
+            except KeyError:
+                self.logger.warning('Configuration "{}" is missing settings. Load it to fill them '
+                                    'in.'.format(name))
+            except (AttributeError, TypeError):
+                self.warn_malformed(name)
         self.save_config(settings)
 
     def get_settings(self):
-        """Retrieve existing configurations, or create the config file if it does not exist."""
+        """Retrieve existing configurations, or create the config file if it does not exist.
+        The parsed settings are reused until the file's modification time or size changes."""
         try:
-            with open(self.file_path, "r") as f:
+            stamp = self.stamp()
+            if self.settings_cache and self.settings_cache[0] == stamp:
+                return self.settings_cache[1]
+            with open(self.file_path, "rb") as f:
                 blob = json.load(f)
+            self.settings_cache = (stamp, blob)
         except FileNotFoundError:
             self.logger.debug("No configuration file. Creating new one at {}."
                               .format(self.file_path))
@@ -117,23 +150,7 @@ class Configurator(object):
                 if name in existing.keys():
                     print('The name "{0}" is not unique.'.format(name))
                     name = ""
-            settings = {name: {}}
-            settings[name]["nick"] = self.prompt("Nick", "GorillaBot")
-            settings[name]["realname"] = self.prompt("Ident", "GorillaBot")
-            settings[name]["ident"] = self.prompt("Realname", "GorillaBot")
-            chans = re.split(',? ', self.prompt("Channel(s)"))
-            botops = re.split(',? ', self.prompt("Bot operator(s)", ''))
-            settings[name]["password"] = self.prompt("Server password (optional)", hidden=True)
-            settings[name]["youtube"] = self.prompt("YouTube API key (optional)", hidden=True)
-            settings[name]["forecast"] = self.prompt("Forecast.io API key (optional)", hidden=True)
-            settings[name]["chans"] = {}
-            settings[name]["botops"] = {}
-            for chan in chans:
-                if chan:
-                    settings[name]["chans"][chan] = {"joined": False, "settings": {}}
-            for op in botops:
-                if op:
-                    settings[name]["botops"][op] = {"user": "", "host": ""}
+            settings = {name: {option: self.prompt_setting(option) for option in self.OPTIONS}}
             verify = self.verify(settings, name)
         new_settings = self.get_settings()
         new_settings.update(settings)
@@ -141,8 +158,37 @@ class Configurator(object):
         return name
 
     def load_settings(self):
-        """Show a given configuration."""
-        return self.display()
+        """Show a given configuration, first prompting for any settings it is missing. Returns
+        None if the configuration is malformed and cannot be loaded."""
+        settings = self.get_settings()
+        name = self.choose(settings)
+        config = settings[name]
+        if not isinstance(config, dict):
+            self.warn_malformed(name)
+            return None
+        missing = [option for option in self.OPTIONS if option not in config]
+        if missing:
+            print('Configuration "{0}" is missing {1}.'.format(name, ", ".join(missing)))
+            # Only save once every missing setting has been answered
+            answers = {option: self.prompt_setting(option) for option in missing}
+            config.update(answers)
+            self.save_config(settings)
+        return self.display(settings, name)
+
+    def warn_malformed(self, name):
+        """Tell the user that a configuration needs to be fixed or removed by hand."""
+        self.logger.warning('Configuration "{}" is malformed. Remove it or fix {} by '
+                            'hand.'.format(name, self.file_path))
+
+    def choose(self, settings):
+        """Prompt the user until they name an existing configuration."""
+        name = ""
+        while name == "":
+            name = input("Please choose an existing configuration: ")
+            if name not in settings.keys():
+                print("No configuration named {}.".format(name))
+                name = ""
+        return name
 
     def delete(self):
         """Delete a configuration."""
@@ -158,12 +204,7 @@ class Configurator(object):
         """Display a configuration."""
         if not settings:
             settings = self.get_settings()
-            name = ""
-            while name == "":
-                name = input("Please choose an existing configuration: ")
-                if name not in settings.keys():
-                    print("No configuration named {}.".format(name))
-                    name = ""
+            name = self.choose(settings)
         chans = ", ".join(settings[name]["chans"].keys())
         botops = ", ".join(settings[name]["botops"].keys())
         password = "[hidden]" if settings[name]["password"] else "[none]"
@@ -187,8 +228,27 @@ class Configurator(object):
 
     def save_config(self, new_settings):
         """Save changes to the configuration table."""
+        data = json.dumps(new_settings, indent=4)
         with open(self.file_path, "w") as f:
-            json.dump(new_settings, f, indent=4)
+            f.write(data)
+        self.settings_cache = (self.stamp(), new_settings)
+
+    def stamp(self):
+        """Identify the current contents of the configuration file without reading it."""
+        stat = os.stat(self.file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def prompt_setting(self, option):
+        """Prompt the user for the value of one of the configuration options."""
+        if option == "chans":
+            chans = [c if c.startswith('#') else '#' + c
+                     for c in _SEP_RE.split(self.prompt("Channel(s)").strip()) if c]
+            return {chan: {"joined": False, "settings": {}} for chan in chans}
+        if option == "botops":
+            botops = [o for o in _SEP_RE.split(self.prompt("Bot operator(s)", '').strip()) if o]
+            return {op: {"user": "", "host": ""} for op in botops}
+        field, default, hidden = self.PROMPTS[option]
+        return self.prompt(field, default, hidden)
 
     def prompt(self, field, default=None, hidden=False):
         """Prompt a user for input, displaying a default value if one exists."""
@@ -198,6 +258,8 @@ class Configurator(object):
         if not hidden:
             answer = input(field)
         else:
+            # Only needed for password and API key prompts
+            from getpass import getpass
             answer = getpass(field)
         if default is not None and answer == '':
             return default
@@ -20,9 +20,15 @@ import plugins
 import re
 from time import time
 
+_URL_RE = re.compile(r'(https?://\S+)')
+_WIKILINK_RE = re.compile(r'\[{2}(.*?)\]{2}')
+_SPOTIFY_RE = re.compile(r'spotify(?::|\.com)')
+
 
 class Message(object):
     """Base class to represent a message received from the IRC server."""
+    __slots__ = ("logger", "bot", "location", "sender", "body", "trigger", "args",
+                 "needs_own_thread", "is_pm")
 
     def __init__(self, bot, location, sender, body):
         self.logger = logging.getLogger("GorillaBot")
@@ -42,16 +48,17 @@ class Message(object):
 
 class Command(Message):
     """Represents a command from a user."""
+    __slots__ = ("line", "admin", "command")
 
-    def __init__(self, *args):
+    def __init__(self, *args, is_pm=False):
         self.line = args[4:]
         self.admin = False
-        super(Command, self).__init__(args[0], args[3], args[1][1:], " ".join(args[4:]))
+        super(Command, self).__init__(args[0], args[3], args[1][1:], " ".join(self.line))
         nick = self.bot.configuration["nick"]
-        if self.line[0].strip("!:") == nick:
+        if self.line and self.line[0].strip("!:") == nick:
             self.line = self.line[1:]
-        if self.location == nick:
-            self.location = self.bot.parse_hostmask(self.sender)['nick']
+        if is_pm:
+            self.location = self.sender.partition('!')[0]
             self.is_pm = True
         if self.line:
             self.command = self.line[0].strip("!:")
@@ -74,7 +81,7 @@ class Command(Message):
             auto_spotify = self.is_pm or self.bot.get_setting('spotify', self.location) == 'auto'
             batman = self.bot.get_setting('batman', self.location) == 'on'
             if auto_link:
-                m = re.findall(r'(https?://\S+)', self.body)
+                m = _URL_RE.findall(self.body)
                 if m:
                     self.needs_own_thread = True
                     self.trigger = plugins.link.link
@@ -82,7 +89,7 @@ class Command(Message):
                     self.args.append(m)
                     return
             if auto_spotify:
-                m = re.findall(r'spotify(?::|\.com)', self.body)
+                m = _SPOTIFY_RE.findall(self.body)
                 if m:
                     self.needs_own_thread = True
                     self.trigger = plugins.spotify.spotify
@@ -101,6 +108,7 @@ class Command(Message):
 
 class Notice(Message):
     """Represent a notice received from the server or another user."""
+    __slots__ = ()
 
     def __init__(self, *args):
         super(Notice, self).__init__(args[0], args[3], args[1][1:], " ".join(args[4:]))
@@ -122,6 +130,7 @@ class Notice(Message):
 
 class Numeric(Message):
     """Represent a numeric reply from the server."""
+    __slots__ = ("number",)
 
     def __init__(self, *args):
         self.number = args[2]
@@ -150,6 +159,7 @@ class Numeric(Message):
 
 class Ping(Message):
     """Represent a ping from the server."""
+    __slots__ = ("type",)
 
     def __init__(self, *args):
         if args[1] == "PING" or args[1] == "PONG":
@@ -175,11 +185,12 @@ class Ping(Message):
 
 class Privmsg(Message):
     """Represents a PRIVMSG from a user."""
+    __slots__ = ("urls",)
 
-    def __init__(self, *args):
+    def __init__(self, *args, is_pm=False):
         super(Privmsg, self).__init__(args[0], args[3], args[1][1:], " ".join(args[4:]))
-        if self.location == self.bot.configuration["nick"]:
-            self.location = self.bot.parse_hostmask(self.sender)['nick']
+        if is_pm:
+            self.location = self.sender.partition('!')[0]
             self.is_pm = True
         self.urls = None
         self.set_trigger()
@@ -194,8 +205,8 @@ class Privmsg(Message):
         batman = self.bot.get_setting('batman', self.location) == 'on'
         # TODO: This needs to be done better :S
         if auto_link:
-            m = re.findall(r'(https?://\S+)', self.body)
-            wikilinks = re.findall(r'\[{2}(.*?)\]{2}', self.body)
+            m = _URL_RE.findall(self.body)
+            wikilinks = _WIKILINK_RE.findall(self.body)
             if m or wikilinks:
                 self.needs_own_thread = True
                 self.trigger = plugins.link.link
@@ -204,7 +215,7 @@ class Privmsg(Message):
                 self.args.append(wikilinks)
                 return
         if auto_spotify:
-            m = re.findall(r'spotify(?::|\.com)', self.body)
+            m = _SPOTIFY_RE.findall(self.body)
             if m:
                 self.needs_own_thread = True
                 self.trigger = plugins.spotify.spotify
@@ -43,7 +43,7 @@ def hug(m):
         users = [x for x in match.groups() if x] if match else []
         if users == []:
             m.bot.action(m.location, "distributes {0} evenly among the channel"
-                         .format(get_line(m, "hugs.txt")))
+                         .format(get_line("hugs.txt")))
         else:
             bot_nick = m.bot.configuration["nick"]
             for user in users:
@@ -51,14 +51,14 @@ def hug(m):
                     _hug_back(m)
                     users.remove(user)
             if users != []:
-                m.bot.action(m.location, "{0} {1}".format(get_line(m, "hugs.txt"),
+                m.bot.action(m.location, "{0} {1}".format(get_line("hugs.txt"),
                                                           humanize_list(users)))
 
 
 def _hug_back(m):
     """Helper function to return a hug."""
     sender_nick = m.bot.parse_hostmask(m.sender)['nick']
-    m.bot.action(m.location, "{0} {1} back".format(get_line(m, "hugs.txt"), sender_nick))
+    m.bot.action(m.location, "{0} {1} back".format(get_line("hugs.txt"), sender_nick))
 
 
 @command("pickupline", "flirts")
@@ -80,7 +80,7 @@ def flirt(m):
                      m.body)
     users = [x for x in match.groups() if x] if match else []
     if users == []:
-        m.bot.private_message(m.location, get_line(m, "flirt.txt"))
+        m.bot.private_message(m.location, get_line("flirt.txt"))
     else:
         bot_nick = m.bot.configuration["nick"]
         for user in users:
@@ -89,4 +89,4 @@ def flirt(m):
                 users.append(m.bot.parse_hostmask(m.sender)["nick"])
         if users != []:
             m.bot.private_message(m.location, humanize_list(users) + ": " +
-                                  get_line(m, "flirt.txt"))
+                                  get_line("flirt.txt"))
@@ -22,10 +22,10 @@ from plugins.util import get_line
 def alfred(m):
     """Respond with a line from alfred.txt every 1 in 5 times "AlfredBot" is mentioned."""
     if random() < 0.2:
-        m.bot.private_message(m.location, get_line(m, "alfred.txt"))
+        m.bot.private_message(m.location, get_line("alfred.txt"))
 
 
 def batman(m):
     """Respond with a line from batman.txt every 1 in 5 times "batman" is mentioned."""
     if random() < 0.2:
-        m.bot.private_message(m.location, get_line(m, "batman.txt"))
+        m.bot.private_message(m.location, get_line("batman.txt"))
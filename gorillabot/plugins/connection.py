@@ -30,7 +30,7 @@ def join(m):
         m.bot.private_message(m.location, "Please specify a channel to join.")
     else:
         chan = m.line[1]
-        if chan[0] != "#":
+        if not chan.startswith("#"):
             m.bot.private_message(m.location, "Not a valid channel name.")
         m.bot.join([chan])
         m.bot.logger.info("Joining " + chan)
@@ -59,7 +59,7 @@ def part(m):
     channel = ""
     if len(m.line) > 2:
         part_msg = " ".join(m.line[2:])
-    if m.line[1][0] != "#":
+    if not m.line[1].startswith("#"):
         m.bot.private_message(m.location, "Not a valid channel name.")
         return
     else:
@@ -31,4 +31,4 @@ def eightball(m):
     #-
     #- Returns a magic 8 ball response.
 
-    m.bot.private_message(m.location, get_line(m, "8ball.txt"))
\ No newline at end of file
+    m.bot.private_message(m.location, get_line("8ball.txt"))
\ No newline at end of file
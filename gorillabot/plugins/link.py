@@ -69,7 +69,7 @@ def link(m, urls=None, wikilinks=None):
             m.bot.private_message(m.location, "Link: " + clean(message))
     for wikilink in wikilinks:
         safe = wikilink.replace(" ", "_")
-        if safe[-1] == ")":
+        if safe.endswith(")"):
             safe = safe[:-1] + "%29"
         m.bot.private_message(m.location, "https://en.wikipedia.org/wiki/" + safe)
 
@@ -42,7 +42,7 @@ def setcommand(m):
     if len(m.line) <= 3:
         chan = m.location
     elif len(m.line) == 4:
-        if m.line[3][0] != "#":
+        if not m.line[3].startswith("#"):
             m.bot.private_message(m.location, 'Poorly-formatted command. '
                                               'Use "!set setting value [#channel]".')
             return
@@ -96,7 +96,7 @@ def unset(m):
     #- Removes the setting for a channel. This will revert to the default value. Settings can only
     #- be edited for channels the bot is joined to, or has been joined to in the past.
 
-    if len(m.line) != 2 and not (len(m.line) == 3 and m.line[2][0] == "#"):
+    if len(m.line) != 2 and not (len(m.line) == 3 and m.line[2].startswith("#")):
         m.bot.private_message(m.location,
                               'Poorly-formatted command. Use "!unset setting [#channel]".')
         return
@@ -20,12 +20,15 @@ from random import choice
 import os
 import pickle
 
+_PLUGINS_PATH = os.path.dirname(os.path.abspath(__file__))
+_responses = {}  # Lines of each response file, read on first use
+
 
 def admin(*args):
     """Designates bot administrator-only commands. Args is a list of command aliases."""
 
     def decorator(func):
-        path = os.path.dirname(os.path.abspath(__file__)) + '/commands.pkl'
+        path = os.path.join(_PLUGINS_PATH, 'commands.pkl')
         try:
             with open(path, 'rb') as pickle_file:
                 commands = pickle.load(pickle_file)
@@ -47,7 +50,7 @@ def command(*args):
     """Designates general bot commands. Args is a list of command aliases."""
 
     def decorator(func):
-        path = os.path.dirname(os.path.abspath(__file__)) + '/admincommands.pkl'
+        path = os.path.join(_PLUGINS_PATH, 'admincommands.pkl')
         try:
             with open(path, 'rb') as pickle_file:
                 commands = pickle.load(pickle_file)
@@ -65,12 +68,13 @@ def command(*args):
     return decorator
 
 
-def get_line(m, file):
-    """Get a random line from the given file."""
-    with open(m.bot.base_path + '/plugins/responses/' + file, 'r') as resps:
-        lines = resps.read().splitlines()
-        l = choice(lines)
-        return l
+def get_line(file):
+    """Get a random line from the given response file. Each file is read once and kept in memory,
+    so edits to it take effect when the bot is restarted."""
+    if file not in _responses:
+        with open(os.path.join(_PLUGINS_PATH, 'responses', file), 'r') as resps:
+            _responses[file] = resps.read().splitlines()
+    return choice(_responses[file])
 
 
 def get_url(m, url, title=False):
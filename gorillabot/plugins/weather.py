@@ -132,7 +132,7 @@ def format_weather_now(blob, loc):
     w["humidity"] = round(blob["currently"]["humidity"] * 100)
     wind = blob["currently"]["windSpeed"]
 
-    w["summary"] = summary + "." if summary[-1] != "." else summary
+    w["summary"] = summary if summary.endswith(".") else summary + "."
     w["temp_f"] = round(temp)
     w["temp_c"] = round(to_celsius(temp))
     w["app_temp_f"] = round(app_temp)